@@ -15,7 +15,7 @@ ELEVENLABS_VOICE_ID = os.getenv("ELEVENLABS_VOICE_ID", "UcqZLa941Kkt8ZhEEybf")
 # ========== FINE-TUNED MODEL CONFIGURATION ==========
 # Replace with your fine-tuned model ID when available
 # Format: "gpt-4o-mini-2024-07-18:ft-[org]:ella-hotel-assistant-v1:[id]"
-ELLA_FINETUNED_MODEL = "ft:gpt-4o-mini-2024-07-18:inapsolutions:ella-demo-v1:BexmNtfD"
+ELLA_FINETUNED_MODEL = os.getenv("ELLA_FINETUNED_MODEL", "ft:gpt-4o-mini-2024-07-18:inapsolutions:ella-demo-v1:BexmNtfD")
 
 # When you complete fine-tuning, update to something like:
 # ELLA_FINETUNED_MODEL = "gpt-4o-mini-2024-07-18:ft-your-org:ella-hotel-assistant-v1:abc123def"
@@ -12,7 +12,7 @@ import json
 # Optional PostgreSQL imports
 try:
     import psycopg2
-    from psycopg2.pool import SimpleConnectionPool
+    from psycopg2.pool import ThreadedConnectionPool
     from psycopg2.extras import RealDictCursor
     POSTGRES_AVAILABLE = True
 except ImportError:
@@ -39,8 +39,10 @@ class PostgreSQLDatabaseManager:
     def _init_postgres(self):
         """Initialize PostgreSQL connection pool"""
         try:
-            self.connection_pool = SimpleConnectionPool(
-                minconn=1,
+            # Threaded pool: FastAPI runs sync handlers on a threadpool, and
+            # SimpleConnectionPool is not safe to share between threads
+            self.connection_pool = ThreadedConnectionPool(
+                minconn=2,
                 maxconn=20,
                 dsn=self.database_url
             )
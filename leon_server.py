@@ -16,6 +16,7 @@ from fastapi.responses import RedirectResponse, FileResponse, JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Optional, List, Dict
+import asyncio
 import json
 import os
 from pathlib import Path
@@ -41,12 +42,20 @@ app.mount("/static", StaticFiles(directory="static"), name="static")
 
 # Initialize consolidated PMS system
 try:
-    from pms_manager import pms_manager
+    from pms_manager import pms_manager, DB_QUERY_LOG_ENABLED, track_queries
     PMS_SYSTEM_AVAILABLE = True
     print("LEON: Consolidated PMS system initialized")
 except ImportError as e:
     print(f"LEON: PMS system not available: {e}")
     PMS_SYSTEM_AVAILABLE = False
+    DB_QUERY_LOG_ENABLED = False
+
+if DB_QUERY_LOG_ENABLED:
+    @app.middleware("http")
+    async def pms_query_budget(request: Request, call_next):
+        """Warn about requests that exceed the PMS query budget or repeat a query"""
+        with track_queries(f"{request.method} {request.url.path}"):
+            return await call_next(request)
 
 # Initialize full media management system
 try:
@@ -221,13 +230,13 @@ async def update_inventory(property_id: str, inventory_data: dict):
 
 @app.get("/api/pms/hotels/{property_id}/bookings")
 async def get_hotel_bookings(property_id: str, booking_status: str = None,
-                           start_date: str = None, end_date: str = None):
-    """Get bookings for a hotel"""
+                           start_date: str = None, end_date: str = None, limit: int = 500):
+    """Get bookings for a hotel (newest first, at most limit)"""
     if not PMS_SYSTEM_AVAILABLE:
         raise HTTPException(status_code=503, detail="PMS system not available")
     
     try:
-        bookings = pms_manager.get_bookings(property_id, booking_status, start_date, end_date)
+        bookings = pms_manager.get_bookings(property_id, booking_status, start_date, end_date, limit)
         return {"success": True, "bookings": bookings}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -278,7 +287,8 @@ async def get_hotel_analytics(property_id: str, days: int = 30):
         raise HTTPException(status_code=503, detail="PMS system not available")
     
     try:
-        result = pms_manager.get_hotel_analytics(property_id, days)
+        # Blocking SQLite work runs in a worker thread so other requests keep being served
+        result = await asyncio.to_thread(pms_manager.get_hotel_analytics, property_id, days)
         if result["success"]:
             return result
         else:
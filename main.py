@@ -1691,4 +1691,9 @@ if __name__ == "__main__":
     print("Dashboard: Full PMS management capabilities")
     print(f"Guest interface: http://localhost:{port}")
     print(f"Dashboard interface: http://localhost:{port}/static/leon_dashboard.html")
-    uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
+    
+    # WEB_CONCURRENCY > 1 runs several worker processes, which uvicorn can only
+    # spawn from an import string. uvloop/httptools are picked up automatically
+    # when installed (uvicorn[standard]).
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    uvicorn.run("main:app" if workers > 1 else app, host="0.0.0.0", port=port, workers=workers) 
\ No newline at end of file
@@ -4,60 +4,609 @@ PMS Manager - Consolidated Property Management System
 Unified hotel operations management for LEON dashboard
 """
 
+import functools
+import itertools
+import os
 import sqlite3
 import json
+import queue
+import re
+import threading
+import time
 import uuid
-from datetime import datetime, date, timedelta
-from typing import Dict, List, Optional, Tuple
+from collections import Counter, OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import date, timedelta
+from typing import Dict, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+# Redis is optional here; without it analytics are cached per process only
+try:
+    import redis
+except ImportError:
+    redis = None
+
+# Applied once to every connection when it is opened
+_CONNECTION_PRAGMAS = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
+    PRAGMA mmap_size=268435456;
+"""
+
+# update_inventory's "set values" statements, keyed by which of
+# (available_rooms, current_price) are being set, so the SQL text is built once
+# and every call reuses the connection's cached prepared statement
+_SET_INVENTORY_SQL = {
+    (True, False): """
+        UPDATE room_inventory 
+        SET available_rooms = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE property_id = ? AND room_type_id = ? AND stay_date BETWEEN ? AND ?
+        RETURNING stay_date
+    """,
+    (False, True): """
+        UPDATE room_inventory 
+        SET current_price = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE property_id = ? AND room_type_id = ? AND stay_date BETWEEN ? AND ?
+        RETURNING stay_date
+    """,
+    (True, True): """
+        UPDATE room_inventory 
+        SET available_rooms = ?, current_price = ?, updated_at = CURRENT_TIMESTAMP
+        WHERE property_id = ? AND room_type_id = ? AND stay_date BETWEEN ? AND ?
+        RETURNING stay_date
+    """,
+}
+
+# Read queries, kept as module constants so every call passes the same string
+# to the pooled connection's prepared-statement cache
+# get_all_hotels
+_SQL_GET_HOTELS = """
+    SELECT property_id, hotel_name, city_name, state_name, country_name,
+           star_rating, address, phone, email, is_active, created_at
+    FROM hotels
+    ORDER BY hotel_name
+"""
+
+# get_hotel_details
+_SQL_HOTEL_DETAILS = """
+    SELECT h.property_id, h.hotel_name, h.city_name, h.state_name, h.country_name,
+           h.star_rating, h.address, h.phone, h.email, h.is_active,
+           COUNT(DISTINCT rt.room_type_id) as room_types_count,
+           COUNT(DISTINCT CASE WHEN b.booking_status = 'CONFIRMED' THEN b.booking_id END) as active_bookings
+    FROM hotels h
+    LEFT JOIN room_types rt ON h.property_id = rt.property_id
+    LEFT JOIN bookings b ON h.property_id = b.property_id AND b.booking_status = 'CONFIRMED'
+    WHERE h.property_id = ?
+    GROUP BY h.property_id
+"""
+
+# get_room_types
+_SQL_ROOM_TYPES = """
+    SELECT room_type_id, room_name, bed_type, view_type, max_occupancy,
+           room_size_sqm, total_rooms, base_price_per_night, amenities,
+           room_features, is_active
+    FROM room_types
+    WHERE property_id = ?
+    ORDER BY room_name
+"""
+
+# get_inventory_status; a NULL :room_type_id selects every room type
+_SQL_INVENTORY = """
+    SELECT ri.stay_date, ri.room_type_id, ri.available_rooms, ri.current_price,
+           rt.room_name, rt.total_rooms,
+           COALESCE((SELECT SUM(b.rooms_booked)
+                     FROM bookings b
+                     WHERE b.property_id = ri.property_id
+                           AND b.room_type_id = ri.room_type_id
+                           AND b.booking_status = 'CONFIRMED'
+                           AND b.check_in_date <= ri.stay_date
+                           AND b.check_out_date > ri.stay_date), 0) as booked_rooms
+    FROM room_inventory ri
+    JOIN room_types rt ON ri.property_id = rt.property_id
+                       AND ri.room_type_id = rt.room_type_id
+    WHERE ri.property_id = :property_id
+          AND (:room_type_id IS NULL OR ri.room_type_id = :room_type_id)
+          AND ri.stay_date BETWEEN :start_date AND :end_date
+    ORDER BY ri.stay_date, rt.room_name
+"""
+
+# get_bookings, before its optional filters, ORDER BY and LIMIT
+_SQL_BOOKINGS_BASE = """
+    SELECT b.booking_id, b.booking_reference, h.hotel_name, rt.room_name,
+           b.guest_name, b.guest_email, b.guest_phone,
+           b.check_in_date, b.check_out_date, b.nights, b.rooms_booked,
+           b.total_price, b.currency, b.booking_status, b.payment_status,
+           b.special_requests, b.booked_at, b.updated_at
+    FROM bookings b
+    JOIN hotels h ON b.property_id = h.property_id
+    JOIN room_types rt ON b.room_type_id = rt.room_type_id
+    WHERE 1=1
+"""
+
+# get_bookings' optional filters, in parameter order
+_BOOKING_FILTERS = (
+    " AND b.property_id = ?",
+    " AND b.booking_status = ?",
+    " AND b.check_in_date >= ?",
+    " AND b.check_out_date <= ?",
+)
+
+# Every combination of get_bookings filters, keyed by which ones are present, so
+# a call picks its finished SQL string instead of concatenating one per request
+_SQL_BOOKINGS = {
+    present: _SQL_BOOKINGS_BASE
+    + "".join(clause for clause, wanted in zip(_BOOKING_FILTERS, present) if wanted)
+    + " ORDER BY b.booked_at DESC LIMIT ?"
+    for present in itertools.product((False, True), repeat=len(_BOOKING_FILTERS))
+}
+
+# The dashboard's usual call: one hotel's bookings, no other filters
+_SQL_BOOKINGS_BY_PROP = _SQL_BOOKINGS[(True, False, False, False)]
+
+# Default cap on get_bookings rows; pass limit=None for every matching booking
+BOOKINGS_DEFAULT_LIMIT = 500
+
+# get_hotel_analytics: booking totals, occupancy and the room type breakdown in one
+# round-trip. The roll-up is aggregated per room type once, then summed into a
+# single 'summary' row (sorted first) and joined to room_types for the 'perf' rows
+_SQL_HOTEL_ANALYTICS = """
+    WITH ad AS (
+        SELECT room_type_id,
+               SUM(bookings) as bookings,
+               SUM(confirmed) as confirmed,
+               SUM(cancelled) as cancelled,
+               SUM(revenue) as revenue,
+               SUM(room_nights) as room_nights
+        FROM analytics_daily
+        WHERE property_id = :property_id AND day >= :start_date
+        GROUP BY room_type_id
+    )
+    SELECT 'summary' as kind, NULL as room_name,
+           bs.total_bookings, bs.confirmed_bookings, bs.cancelled_bookings,
+           CASE WHEN bs.total_bookings > 0
+                THEN bs.confirmed_bookings * 1.0 / bs.total_bookings * 100 ELSE 0 END as conversion_rate,
+           bs.total_revenue,
+           CASE WHEN bs.confirmed_bookings > 0
+                THEN bs.total_revenue * 1.0 / bs.confirmed_bookings ELSE 0 END as average_per_booking,
+           ROUND((cs.total_room_capacity - cs.total_available) * 1.0 / cs.total_room_capacity * 100, 2) as occupancy_rate,
+           bs.total_room_nights,
+           cs.total_room_capacity * cs.days_counted as total_capacity
+    FROM (
+        SELECT 
+            COALESCE(SUM(bookings), 0) as total_bookings,
+            COALESCE(SUM(confirmed), 0) as confirmed_bookings,
+            COALESCE(SUM(cancelled), 0) as cancelled_bookings,
+            COALESCE(SUM(revenue), 0) as total_revenue,
+            COALESCE(SUM(room_nights), 0) as total_room_nights
+        FROM ad
+    ) bs
+    CROSS JOIN (
+        -- No inventory in the window counts as one room over one day
+        SELECT 
+            COALESCE(NULLIF(SUM(rt.total_rooms), 0), 1) as total_room_capacity,
+            COALESCE(SUM(ri.available_rooms), 0) as total_available,
+            MAX(COUNT(DISTINCT ri.stay_date), 1) as days_counted
+        FROM room_inventory ri
+        JOIN room_types rt ON ri.property_id = rt.property_id 
+                           AND ri.room_type_id = rt.room_type_id
+        WHERE ri.property_id = :property_id
+          AND ri.stay_date BETWEEN :start_date AND :end_date
+    ) cs
+    UNION ALL
+    SELECT 'perf', rt.room_name,
+           COALESCE(ad.confirmed, 0),
+           COALESCE(ad.revenue, 0),
+           NULL, NULL, NULL, NULL, NULL, NULL, NULL
+    FROM room_types rt
+    LEFT JOIN ad ON rt.room_type_id = ad.room_type_id
+    WHERE rt.property_id = :property_id
+    ORDER BY 1 DESC, 4 DESC
+"""
+
+# Composite indexes for the PMS booking filters. room_inventory lookups and
+# booking_reference are already covered by the tables' UNIQUE constraints.
+_PMS_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS idx_bookings_property_status_booked ON bookings(property_id, booking_status, booked_at)",
+    "CREATE INDEX IF NOT EXISTS idx_bookings_room_type_status ON bookings(room_type_id, booking_status)",
+    # Occupancy ranges over stay_date for a whole hotel; the UNIQUE key puts room_type_id first
+    "CREATE INDEX IF NOT EXISTS idx_room_inventory_property_date ON room_inventory(property_id, stay_date, room_type_id, available_rooms)",
+)
+
+def _ensure_indexes(conn: sqlite3.Connection):
+    """Create the PMS indexes if missing and refresh planner statistics"""
+    try:
+        for index_sql in _PMS_INDEXES:
+            conn.execute(index_sql)
+        conn.commit()
+        # Cheap ANALYZE: only re-gathers statistics the planner would benefit from
+        conn.execute("PRAGMA optimize")
+    except sqlite3.OperationalError as e:
+        # Tables not created yet (fresh database) - retried on the next manager start
+        conn.rollback()
+        print(f"Skipping PMS indexes: {e}")
+
+# Per-hotel, per-room-type, per-booking-day booking totals for get_hotel_analytics.
+# Triggers on bookings keep it current for every writer (not just this module), so
+# analytics sums a few rows per day instead of scanning the bookings window, and the
+# room performance breakdown reads the same rows grouped by room type.
+_ANALYTICS_DAILY_TABLE = """
+    CREATE TABLE IF NOT EXISTS analytics_daily (
+        property_id TEXT NOT NULL,
+        day TEXT NOT NULL,
+        room_type_id TEXT NOT NULL,
+        bookings INTEGER NOT NULL DEFAULT 0,
+        confirmed INTEGER NOT NULL DEFAULT 0,
+        cancelled INTEGER NOT NULL DEFAULT 0,
+        revenue REAL NOT NULL DEFAULT 0,
+        room_nights INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (property_id, day, room_type_id)
+    ) WITHOUT ROWID
+"""
+
+# Add (NEW) or remove (OLD) one booking's contribution to its day's totals
+_ANALYTICS_DAILY_ADD = """
+        INSERT INTO analytics_daily (property_id, day, room_type_id, bookings, confirmed, cancelled, revenue, room_nights)
+        VALUES (NEW.property_id, date(NEW.booked_at), COALESCE(NEW.room_type_id, ''), 1,
+                NEW.booking_status = 'CONFIRMED',
+                NEW.booking_status = 'CANCELLED',
+                CASE WHEN NEW.booking_status = 'CONFIRMED' THEN COALESCE(NEW.total_price, 0) ELSE 0 END,
+                CASE WHEN NEW.booking_status = 'CONFIRMED' THEN COALESCE(NEW.rooms_booked, 0) ELSE 0 END)
+        ON CONFLICT (property_id, day, room_type_id) DO UPDATE SET
+            bookings = bookings + excluded.bookings,
+            confirmed = confirmed + excluded.confirmed,
+            cancelled = cancelled + excluded.cancelled,
+            revenue = revenue + excluded.revenue,
+            room_nights = room_nights + excluded.room_nights;
+"""
+_ANALYTICS_DAILY_REMOVE = """
+        UPDATE analytics_daily SET
+            bookings = bookings - 1,
+            confirmed = confirmed - (OLD.booking_status = 'CONFIRMED'),
+            cancelled = cancelled - (OLD.booking_status = 'CANCELLED'),
+            revenue = revenue - CASE WHEN OLD.booking_status = 'CONFIRMED' THEN COALESCE(OLD.total_price, 0) ELSE 0 END,
+            room_nights = room_nights - CASE WHEN OLD.booking_status = 'CONFIRMED' THEN COALESCE(OLD.rooms_booked, 0) ELSE 0 END
+        WHERE property_id = OLD.property_id AND day = date(OLD.booked_at)
+          AND room_type_id = COALESCE(OLD.room_type_id, '');
+"""
+_ANALYTICS_DAILY_TRIGGERS = (
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_analytics_daily_insert
+    AFTER INSERT ON bookings WHEN NEW.booked_at IS NOT NULL
+    BEGIN {_ANALYTICS_DAILY_ADD} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_analytics_daily_delete
+    AFTER DELETE ON bookings WHEN OLD.booked_at IS NOT NULL
+    BEGIN {_ANALYTICS_DAILY_REMOVE} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_analytics_daily_update_old
+    AFTER UPDATE OF property_id, room_type_id, booked_at, booking_status, total_price, rooms_booked ON bookings
+    WHEN OLD.booked_at IS NOT NULL
+    BEGIN {_ANALYTICS_DAILY_REMOVE} END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS trg_analytics_daily_update_new
+    AFTER UPDATE OF property_id, room_type_id, booked_at, booking_status, total_price, rooms_booked ON bookings
+    WHEN NEW.booked_at IS NOT NULL
+    BEGIN {_ANALYTICS_DAILY_ADD} END
+    """,
+)
+
+# One-off backfill when the roll-up table is first created
+_ANALYTICS_DAILY_BACKFILL = """
+    INSERT INTO analytics_daily (property_id, day, room_type_id, bookings, confirmed, cancelled, revenue, room_nights)
+    SELECT property_id, date(booked_at), COALESCE(room_type_id, ''), COUNT(*),
+           COUNT(CASE WHEN booking_status = 'CONFIRMED' THEN 1 END),
+           COUNT(CASE WHEN booking_status = 'CANCELLED' THEN 1 END),
+           COALESCE(SUM(CASE WHEN booking_status = 'CONFIRMED' THEN total_price ELSE 0 END), 0),
+           COALESCE(SUM(CASE WHEN booking_status = 'CONFIRMED' THEN rooms_booked ELSE 0 END), 0)
+    FROM bookings
+    WHERE booked_at IS NOT NULL
+    GROUP BY property_id, date(booked_at), COALESCE(room_type_id, '')
+"""
+
+# Per-hotel summary superseded by analytics_daily
+_LEGACY_DAILY_STATS_DROP = (
+    "DROP TRIGGER IF EXISTS trg_hotel_daily_stats_insert",
+    "DROP TRIGGER IF EXISTS trg_hotel_daily_stats_delete",
+    "DROP TRIGGER IF EXISTS trg_hotel_daily_stats_update_old",
+    "DROP TRIGGER IF EXISTS trg_hotel_daily_stats_update_new",
+    "DROP TABLE IF EXISTS hotel_daily_stats",
+)
+
+def _ensure_analytics_daily(conn: sqlite3.Connection):
+    """Create (and on first run backfill) the analytics_daily roll-up table"""
+    try:
+        # Lock out writers so no booking lands between the backfill and the triggers
+        conn.execute("BEGIN IMMEDIATE")
+        created = not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analytics_daily'"
+        ).fetchone()
+        for drop_sql in _LEGACY_DAILY_STATS_DROP:
+            conn.execute(drop_sql)
+        conn.execute(_ANALYTICS_DAILY_TABLE)
+        for trigger_sql in _ANALYTICS_DAILY_TRIGGERS:
+            conn.execute(trigger_sql)
+        if created:
+            conn.execute(_ANALYTICS_DAILY_BACKFILL)
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        print(f"Skipping PMS analytics roll-up: {e}")
+
+# Hotels change on the order of days; writes that affect a cached result clear it
+HOTEL_CACHE_TTL_SECONDS = 300
+# Dashboards poll analytics; bookings written outside this module show up within a minute
+ANALYTICS_CACHE_TTL_SECONDS = 60
+
+def _ttl_cache(ttl_seconds: float, cache_if=lambda result: True, maxsize: int = 256):
+    """Memoize a method per database and argument tuple for ttl_seconds.
+
+    Only results accepted by cache_if are stored, so errors are never served
+    from the cache. At most maxsize entries are kept: expired entries are
+    pruned first, then the least recently used. The wrapper's cache_clear(*args)
+    drops every entry whose leading arguments match args, or all entries when
+    called without arguments.
+    """
+    def decorator(func):
+        # key -> (expires_at, result); keys are (db_path, *args), oldest use first
+        cache = OrderedDict()
+        lock = threading.Lock()
+        # Bumped by cache_clear so a result computed before a write is not stored after it
+        generation = 0
+        
+        @functools.wraps(func)
+        def wrapper(self, *args):
+            key = (self.db_path,) + args
+            now = time.monotonic()
+            with lock:
+                started_generation = generation
+                entry = cache.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        cache.move_to_end(key)
+                        return entry[1]
+                    del cache[key]
+            # Run the query outside the lock; concurrent misses just compute twice
+            result = func(self, *args)
+            if cache_if(result):
+                with lock:
+                    if generation != started_generation:
+                        return result
+                    cache[key] = (now + ttl_seconds, result)
+                    cache.move_to_end(key)
+                    if len(cache) > maxsize:
+                        for stale in [k for k, (expires_at, _) in cache.items() if expires_at <= now]:
+                            del cache[stale]
+                        while len(cache) > maxsize:
+                            cache.popitem(last=False)
+            return result
+        
+        def cache_clear(*args):
+            nonlocal generation
+            with lock:
+                generation += 1
+                if args:
+                    for key in [key for key in cache if key[1:len(args) + 1] == args]:
+                        del cache[key]
+                else:
+                    cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+# Shared analytics cache across workers. Without REDIS_URL each process keeps
+# only its own in-memory copy.
+REDIS_URL = os.getenv("REDIS_URL")
+ANALYTICS_INVALIDATE_CHANNEL = "analytics_invalidate"
+
+class SharedAnalyticsCache:
+    """Best-effort Redis cache for get_hotel_analytics; errors never fail a request.
+
+    Invalidations are also published so every worker drops its in-process copy.
+    """
+    
+    def __init__(self, redis_url: Optional[str], on_invalidate):
+        self.client = None
+        if redis_url and redis is not None:
+            try:
+                self.client = redis.Redis.from_url(redis_url)
+                self.client.ping()
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(**{
+                    ANALYTICS_INVALIDATE_CHANNEL: lambda message: on_invalidate(message["data"].decode())
+                })
+                pubsub.run_in_thread(sleep_time=1.0, daemon=True)
+            except Exception as e:
+                print(f"⚠️ Redis unavailable, PMS analytics cached per process only: {e}")
+                self.client = None
+    
+    @staticmethod
+    def _key(property_id: str, days: int) -> str:
+        return f"analytics:{property_id}:{days}"
+    
+    def get(self, property_id: str, days: int) -> Optional[Dict]:
+        if self.client is None:
+            return None
+        try:
+            cached = self.client.get(self._key(property_id, days))
+        except Exception:
+            return None
+        return json.loads(cached) if cached is not None else None
+    
+    def set(self, property_id: str, days: int, value: Dict):
+        if self.client is None:
+            return
+        try:
+            self.client.setex(self._key(property_id, days), ANALYTICS_CACHE_TTL_SECONDS, json.dumps(value))
+        except Exception:
+            pass
+    
+    def invalidate(self, property_id: str):
+        """Drop the hotel's cached analytics and tell the other workers to do the same"""
+        if self.client is None:
+            return
+        try:
+            keys = list(self.client.scan_iter(match=f"analytics:{property_id}:*", count=500))
+            if keys:
+                self.client.unlink(*keys)
+            self.client.publish(ANALYTICS_INVALIDATE_CHANNEL, property_id)
+        except Exception:
+            pass
+
+# Idle read connections kept for reuse; extra concurrent readers get a temporary one
+POOL_SIZE = 8
+
+# Opt-in per-request query accounting. With DB_QUERY_LOG_ENABLED=1 every PMS
+# connection reports its statements, and track_queries() warns when one request
+# runs more than the budget or repeats one statement shape (an N+1 loop).
+DB_QUERY_LOG_ENABLED = os.getenv("DB_QUERY_LOG_ENABLED") == "1"
+DB_QUERY_LOG_N1_THRESHOLD = int(os.getenv("DB_QUERY_LOG_N1_THRESHOLD", 3))
+DB_QUERY_LOG_BUDGET = int(os.getenv("DB_QUERY_LOG_BUDGET", 20))
+
+_query_counts: ContextVar[Optional[Counter]] = ContextVar("pms_query_counts", default=None)
+_SQL_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+def _record_query(sql: str):
+    """sqlite3 trace callback: count the statement's shape for the current request"""
+    counts = _query_counts.get()
+    if counts is not None:
+        counts[_SQL_LITERALS.sub("?", " ".join(sql.split()))] += 1
+
+@contextmanager
+def track_queries(label: str):
+    """Count PMS queries run inside the block (including worker threads it starts)"""
+    counts = Counter()
+    token = _query_counts.set(counts)
+    try:
+        yield counts
+    finally:
+        _query_counts.reset(token)
+        if counts:
+            total = sum(counts.values())
+            statement, repeats = counts.most_common(1)[0]
+            if total > DB_QUERY_LOG_BUDGET:
+                print(f"⚠️ {label}: {total} PMS queries (budget {DB_QUERY_LOG_BUDGET})")
+            if repeats > DB_QUERY_LOG_N1_THRESHOLD:
+                print(f"⚠️ {label}: possible N+1, {repeats}x {statement[:200]}")
+
+def _parse_ymd(value: str) -> date:
+    """Parse a YYYY-MM-DD string (C fast path, unlike datetime.strptime)"""
+    return date.fromisoformat(value)
+
+def _rows_to_dicts(cursor: sqlite3.Cursor) -> List[Dict]:
+    """Materialise a cursor's rows as dicts, zipping plain tuples with column names read once"""
+    # Plain tuples + zip is markedly cheaper than dict(sqlite3.Row), which looks
+    # every column up by name
+    cursor.row_factory = None
+    keys = tuple(column[0] for column in cursor.description)
+    return [dict(zip(keys, row)) for row in cursor]
+
+def _iter_row_dicts(cursor: sqlite3.Cursor) -> Iterator[Dict]:
+    """Streaming counterpart of _rows_to_dicts: yield each row as a dict"""
+    cursor.row_factory = None
+    keys = tuple(column[0] for column in cursor.description)
+    for row in cursor:
+        yield dict(zip(keys, row))
+
 class PMSManager:
     """Consolidated Property Management System for hotel operations"""
     
     def __init__(self, db_path: str = "ella.db"):
         self.db_path = db_path
+        # SQLite allows a single writer, so writes share one dedicated connection
+        # while reads borrow query_only connections that run concurrently under WAL
+        self._read_pool = queue.LifoQueue(maxsize=POOL_SIZE)
+        self._writer_conn = None
+        self._writer_lock = threading.Lock()
+        self._shared_cache = SharedAnalyticsCache(REDIS_URL, self.get_hotel_analytics.cache_clear)
     
-    def get_connection(self):
-        """Get database connection"""
-        return sqlite3.connect(self.db_path)
+    def _invalidate_analytics(self, property_id: str):
+        """Drop cached analytics for a hotel in this process, Redis and the other workers"""
+        self.get_hotel_analytics.cache_clear(property_id)
+        self._shared_cache.invalidate(property_id)
+    
+    def _open_connection(self, read_only: bool = False) -> sqlite3.Connection:
+        """Open a database connection with the standard PRAGMAs applied"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        conn.row_factory = sqlite3.Row
+        if DB_QUERY_LOG_ENABLED:
+            conn.set_trace_callback(_record_query)
+        if read_only:
+            conn.execute("PRAGMA query_only=1")
+        return conn
+    
+    @contextmanager
+    def get_connection(self, write: bool = False):
+        """Borrow a database connection for the duration of a with-block.
+
+        write=True yields the single writer connection, held exclusively for the
+        block; otherwise a pooled read-only connection.
+        """
+        if write:
+            with self._writer_lock:
+                if self._writer_conn is None:
+                    self._writer_conn = self._open_connection()
+                    # One-time migration, run when the writer is first opened
+                    _ensure_indexes(self._writer_conn)
+                    _ensure_analytics_daily(self._writer_conn)
+                conn = self._writer_conn
+                try:
+                    yield conn
+                finally:
+                    # Never leave a half-finished transaction on the shared writer
+                    if conn.in_transaction:
+                        conn.rollback()
+            return
+        
+        if self._writer_conn is None:
+            # Make sure the migration has run before the first read relies on it
+            with self.get_connection(write=True):
+                pass
+        
+        try:
+            conn = self._read_pool.get_nowait()
+        except queue.Empty:
+            conn = self._open_connection(read_only=True)
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._read_pool.put_nowait(conn)
+            except queue.Full:
+                conn.close()
     
     # ========================
     # HOTEL MANAGEMENT
     # ========================
     
+    @_ttl_cache(HOTEL_CACHE_TTL_SECONDS, cache_if=bool)
     def get_all_hotels(self) -> List[Dict]:
         """Get all hotels in the system"""
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT property_id, hotel_name, city_name, state_name, country_name,
-                           star_rating, address, phone, email, is_active, created_at
-                    FROM hotels
-                    ORDER BY hotel_name
-                """)
-                
-                hotels = []
-                for row in cursor.fetchall():
-                    hotels.append({
-                        'property_id': row[0],
-                        'hotel_name': row[1],
-                        'city_name': row[2],
-                        'state_name': row[3],
-                        'country_name': row[4],
-                        'star_rating': row[5],
-                        'address': row[6],
-                        'phone': row[7],
-                        'email': row[8],
-                        'is_active': bool(row[9]),
-                        'created_at': row[10]
-                    })
+                cursor.execute(_SQL_GET_HOTELS)
+                
+                # Column names already match the response keys
+                hotels = _rows_to_dicts(cursor)
+                for hotel in hotels:
+                    hotel['is_active'] = bool(hotel['is_active'])
                 
                 return hotels
         except Exception as e:
             print(f"Error getting hotels: {e}")
             return []
     
+    @_ttl_cache(HOTEL_CACHE_TTL_SECONDS, cache_if=lambda result: result["success"])
     def get_hotel_details(self, property_id: str) -> Dict:
         """Get detailed information about a specific hotel"""
         try:
@@ -65,37 +614,19 @@ class PMSManager:
                 cursor = conn.cursor()
                 
                 # Get hotel basic info
-                cursor.execute("""
-                    SELECT h.*, 
-                           COUNT(DISTINCT rt.room_type_id) as room_types_count,
-                           COUNT(DISTINCT CASE WHEN b.booking_status = 'CONFIRMED' THEN b.booking_id END) as active_bookings
-                    FROM hotels h
-                    LEFT JOIN room_types rt ON h.property_id = rt.property_id
-                    LEFT JOIN bookings b ON h.property_id = b.property_id AND b.booking_status = 'CONFIRMED'
-                    WHERE h.property_id = ?
-                    GROUP BY h.property_id
-                """, (property_id,))
+                cursor.execute(_SQL_HOTEL_DETAILS, (property_id,))
                 
                 hotel_data = cursor.fetchone()
                 if not hotel_data:
                     return {"success": False, "message": "Hotel not found"}
                 
+                # Selected columns are named exactly as the response keys
+                hotel = dict(hotel_data)
+                hotel['is_active'] = bool(hotel['is_active'])
+                
                 return {
                     "success": True,
-                    "hotel": {
-                        'property_id': hotel_data[0],
-                        'hotel_name': hotel_data[1],
-                        'city_name': hotel_data[2],
-                        'state_name': hotel_data[3],
-                        'country_name': hotel_data[4],
-                        'star_rating': hotel_data[5],
-                        'address': hotel_data[6],
-                        'phone': hotel_data[7],
-                        'email': hotel_data[8],
-                        'is_active': bool(hotel_data[9]),
-                        'room_types_count': hotel_data[-2],
-                        'active_bookings': hotel_data[-1]
-                    }
+                    "hotel": hotel
                 }
         except Exception as e:
             return {"success": False, "message": f"Error: {str(e)}"}
@@ -104,37 +635,24 @@ class PMSManager:
     # ROOM TYPE MANAGEMENT
     # ========================
     
+    def iter_room_types(self, property_id: str) -> Iterator[Dict]:
+        """Yield a hotel's room types as the cursor is stepped.
+
+        The pooled connection stays borrowed until the iterator is exhausted or closed.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(_SQL_ROOM_TYPES, (property_id,))
+            
+            # Column names already match the response keys
+            for room_type in _iter_row_dicts(cursor):
+                room_type['is_active'] = bool(room_type['is_active'])
+                yield room_type
+    
     def get_room_types(self, property_id: str) -> List[Dict]:
         """Get all room types for a hotel"""
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute("""
-                    SELECT room_type_id, room_name, bed_type, view_type, max_occupancy,
-                           room_size_sqm, total_rooms, base_price_per_night, amenities,
-                           room_features, is_active
-                    FROM room_types
-                    WHERE property_id = ?
-                    ORDER BY room_name
-                """, (property_id,))
-                
-                room_types = []
-                for row in cursor.fetchall():
-                    room_types.append({
-                        'room_type_id': row[0],
-                        'room_name': row[1],
-                        'bed_type': row[2],
-                        'view_type': row[3],
-                        'max_occupancy': row[4],
-                        'room_size_sqm': row[5],
-                        'total_rooms': row[6],
-                        'base_price_per_night': row[7],
-                        'amenities': row[8],
-                        'room_features': row[9],
-                        'is_active': bool(row[10])
-                    })
-                
-                return room_types
+            return list(self.iter_room_types(property_id))
         except Exception as e:
             print(f"Error getting room types: {e}")
             return []
@@ -150,7 +668,7 @@ class PMSManager:
             # Create room_type_id (hotel_id_room_name in lowercase with underscores)
             room_type_id = f"{property_id}_{room_name.lower().replace(' ', '_').replace('-', '_')}"
             
-            with self.get_connection() as conn:
+            with self.get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 
                 # Check if room type already exists
@@ -176,6 +694,8 @@ class PMSManager:
                 ))
                 
                 conn.commit()
+                self.get_hotel_details.cache_clear(property_id)
+                self._invalidate_analytics(property_id)
                 
                 return {
                     "success": True, 
@@ -189,22 +709,17 @@ class PMSManager:
     def update_room_type(self, property_id: str, room_type_id: str, room_data: dict) -> Dict:
         """Update an existing room type"""
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 
-                # Check if room type exists
-                cursor.execute("SELECT room_type_id FROM room_types WHERE room_type_id = ? AND property_id = ?", 
-                             (room_type_id, property_id))
-                if not cursor.fetchone():
-                    return {"success": False, "message": "Room type not found"}
-                
-                # Update room type
+                # Update room type; RETURNING doubles as the existence check
                 cursor.execute("""
                     UPDATE room_types 
                     SET room_name = ?, bed_type = ?, max_occupancy = ?, 
                         base_price_per_night = ?, total_rooms = ?, 
                         room_size_sqm = ?, view_type = ?, updated_at = CURRENT_TIMESTAMP
                     WHERE room_type_id = ? AND property_id = ?
+                    RETURNING room_type_id
                 """, (
                     room_data.get("room_name"),
                     room_data.get("bed_type"),
@@ -215,8 +730,12 @@ class PMSManager:
                     room_data.get("view_type"),
                     room_type_id, property_id
                 ))
+                if not cursor.fetchall():
+                    return {"success": False, "message": "Room type not found"}
                 
                 conn.commit()
+                self.get_hotel_details.cache_clear(property_id)
+                self._invalidate_analytics(property_id)
                 
                 return {
                     "success": True,
@@ -229,16 +748,21 @@ class PMSManager:
     def delete_room_type(self, property_id: str, room_type_id: str) -> Dict:
         """Delete a room type (soft delete by setting is_active = 0)"""
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 
-                # Check if room type exists
-                cursor.execute("SELECT room_type_id FROM room_types WHERE room_type_id = ? AND property_id = ?", 
-                             (room_type_id, property_id))
-                if not cursor.fetchone():
+                # Soft delete room type; RETURNING doubles as the existence check
+                cursor.execute("""
+                    UPDATE room_types 
+                    SET is_active = 0, updated_at = CURRENT_TIMESTAMP
+                    WHERE room_type_id = ? AND property_id = ?
+                    RETURNING room_type_id
+                """, (room_type_id, property_id))
+                if not cursor.fetchall():
                     return {"success": False, "message": "Room type not found"}
                 
-                # Check if there are active bookings for this room type
+                # Check if there are active bookings for this room type; the soft
+                # delete is rolled back when the connection is released
                 cursor.execute("""
                     SELECT COUNT(*) FROM bookings 
                     WHERE room_type_id = ? AND booking_status IN ('CONFIRMED', 'CHECKED_IN')
@@ -248,14 +772,9 @@ class PMSManager:
                 if active_bookings > 0:
                     return {"success": False, "message": f"Cannot delete room type with {active_bookings} active bookings"}
                 
-                # Soft delete room type
-                cursor.execute("""
-                    UPDATE room_types 
-                    SET is_active = 0, updated_at = CURRENT_TIMESTAMP
-                    WHERE room_type_id = ? AND property_id = ?
-                """, (room_type_id, property_id))
-                
                 conn.commit()
+                self.get_hotel_details.cache_clear(property_id)
+                self._invalidate_analytics(property_id)
                 
                 return {
                     "success": True,
@@ -269,82 +788,52 @@ class PMSManager:
     # INVENTORY MANAGEMENT
     # ========================
     
+    def iter_inventory(self, property_id: str, room_type_id: str = None, 
+                       start_date: str = None, end_date: str = None) -> Iterator[Dict]:
+        """Yield per-date inventory rows for a hotel/room type as the cursor is stepped.
+
+        The pooled connection stays borrowed until the iterator is exhausted or closed.
+        """
+        if not start_date:
+            start_date = date.today().isoformat()
+        if not end_date:
+            end_date = (date.today() + timedelta(days=30)).isoformat()
+        
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            # booked_rooms is a correlated subquery (one index seek per inventory
+            # row) rather than a LEFT JOIN + GROUP BY over every overlapping booking
+            cursor.execute(_SQL_INVENTORY, {
+                "property_id": property_id,
+                "room_type_id": room_type_id or None,
+                "start_date": start_date,
+                "end_date": end_date,
+            })
+            
+            # Rows are plain tuples since access is positional
+            cursor.row_factory = None
+            for row in cursor:
+                item = {
+                    'date': row[0],
+                    'available_rooms': row[2],
+                    'current_price': row[3],
+                    'room_name': row[4],
+                    'total_rooms': row[5],
+                    'booked_rooms': row[6],
+                    'sellable_rooms': row[2] - row[6]
+                }
+                if not room_type_id:
+                    # Only the all-room-types view says which room type a row is for
+                    item['room_type_id'] = row[1]
+                yield item
+    
     def get_inventory_status(self, property_id: str, room_type_id: str = None, 
                            start_date: str = None, end_date: str = None) -> Dict:
         """Get inventory status for hotel/room type"""
         try:
-            if not start_date:
-                start_date = date.today().strftime('%Y-%m-%d')
-            if not end_date:
-                end_date = (date.today() + timedelta(days=30)).strftime('%Y-%m-%d')
-            
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                if room_type_id:
-                    # Specific room type
-                    cursor.execute("""
-                        SELECT ri.stay_date, ri.available_rooms, ri.current_price,
-                               rt.room_name, rt.total_rooms,
-                               COALESCE(SUM(b.rooms_booked), 0) as booked_rooms
-                        FROM room_inventory ri
-                        JOIN room_types rt ON ri.property_id = rt.property_id 
-                                           AND ri.room_type_id = rt.room_type_id
-                        LEFT JOIN bookings b ON ri.property_id = b.property_id 
-                                             AND ri.room_type_id = b.room_type_id
-                                             AND b.booking_status = 'CONFIRMED'
-                                             AND b.check_in_date <= ri.stay_date 
-                                             AND b.check_out_date > ri.stay_date
-                        WHERE ri.property_id = ? AND ri.room_type_id = ?
-                              AND ri.stay_date BETWEEN ? AND ?
-                        GROUP BY ri.stay_date, ri.available_rooms, ri.current_price, rt.room_name, rt.total_rooms
-                        ORDER BY ri.stay_date
-                    """, (property_id, room_type_id, start_date, end_date))
-                else:
-                    # All room types
-                    cursor.execute("""
-                        SELECT ri.stay_date, ri.room_type_id, ri.available_rooms, ri.current_price,
-                               rt.room_name, rt.total_rooms,
-                               COALESCE(SUM(b.rooms_booked), 0) as booked_rooms
-                        FROM room_inventory ri
-                        JOIN room_types rt ON ri.property_id = rt.property_id 
-                                           AND ri.room_type_id = rt.room_type_id
-                        LEFT JOIN bookings b ON ri.property_id = b.property_id 
-                                             AND ri.room_type_id = b.room_type_id
-                                             AND b.booking_status = 'CONFIRMED'
-                                             AND b.check_in_date <= ri.stay_date 
-                                             AND b.check_out_date > ri.stay_date
-                        WHERE ri.property_id = ? AND ri.stay_date BETWEEN ? AND ?
-                        GROUP BY ri.stay_date, ri.room_type_id, ri.available_rooms, ri.current_price, rt.room_name, rt.total_rooms
-                        ORDER BY ri.stay_date, rt.room_name
-                    """, (property_id, start_date, end_date))
-                
-                inventory_data = []
-                for row in cursor.fetchall():
-                    if room_type_id:
-                        inventory_data.append({
-                            'date': row[0],
-                            'available_rooms': row[1],
-                            'current_price': row[2],
-                            'room_name': row[3],
-                            'total_rooms': row[4],
-                            'booked_rooms': row[5],
-                            'sellable_rooms': row[1] - row[5]
-                        })
-                    else:
-                        inventory_data.append({
-                            'date': row[0],
-                            'room_type_id': row[1],
-                            'available_rooms': row[2],
-                            'current_price': row[3],
-                            'room_name': row[4],
-                            'total_rooms': row[5],
-                            'booked_rooms': row[6],
-                            'sellable_rooms': row[2] - row[6]
-                        })
-                
-                return {"success": True, "inventory": inventory_data}
-                
+            inventory_data = list(self.iter_inventory(property_id, room_type_id, start_date, end_date))
+            return {"success": True, "inventory": inventory_data}
         except Exception as e:
             return {"success": False, "message": f"Error getting inventory: {str(e)}"}
     
@@ -353,55 +842,44 @@ class PMSManager:
                         current_price: float = None, add_rooms: int = None) -> Dict:
         """Update room inventory"""
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 
-                start = datetime.strptime(start_date, '%Y-%m-%d').date()
-                end = datetime.strptime(end_date, '%Y-%m-%d').date()
+                # Take the write lock up front so the transaction never has to upgrade
+                cursor.execute("BEGIN IMMEDIATE")
                 
-                updated_dates = []
-                current_date = start
+                start = _parse_ymd(start_date)
+                end = _parse_ymd(end_date)
+                # The range is covered by one UPDATE, so each bound is formatted
+                # once rather than once per day
+                range_start, range_end = start.isoformat(), end.isoformat()
                 
-                while current_date <= end:
-                    date_str = current_date.strftime('%Y-%m-%d')
-                    
-                    if add_rooms is not None:
-                        # Add rooms to existing inventory
-                        cursor.execute("""
-                            UPDATE room_inventory 
-                            SET available_rooms = available_rooms + ?,
-                                updated_at = CURRENT_TIMESTAMP
-                            WHERE property_id = ? AND room_type_id = ? AND stay_date = ?
-                        """, (add_rooms, property_id, room_type_id, date_str))
-                    else:
-                        # Set specific values
-                        update_fields = []
-                        values = []
-                        
-                        if available_rooms is not None:
-                            update_fields.append("available_rooms = ?")
-                            values.append(available_rooms)
-                        
-                        if current_price is not None:
-                            update_fields.append("current_price = ?")
-                            values.append(current_price)
-                        
-                        if update_fields:
-                            update_fields.append("updated_at = CURRENT_TIMESTAMP")
-                            values.extend([property_id, room_type_id, date_str])
-                            
-                            cursor.execute(f"""
-                                UPDATE room_inventory 
-                                SET {', '.join(update_fields)}
-                                WHERE property_id = ? AND room_type_id = ? AND stay_date = ?
-                            """, values)
-                    
-                    if cursor.rowcount > 0:
-                        updated_dates.append(date_str)
+                # One UPDATE covers the whole date range; RETURNING reports which
+                # dates actually had an inventory row to update
+                if add_rooms is not None:
+                    # Add rooms to existing inventory
+                    cursor.execute("""
+                        UPDATE room_inventory 
+                        SET available_rooms = available_rooms + ?,
+                            updated_at = CURRENT_TIMESTAMP
+                        WHERE property_id = ? AND room_type_id = ? AND stay_date BETWEEN ? AND ?
+                        RETURNING stay_date
+                    """, (add_rooms, property_id, room_type_id, range_start, range_end))
+                    updated_dates = sorted(row[0] for row in cursor.fetchall())
+                else:
+                    # Set specific values with the prebuilt statement for this field combination
+                    sql = _SET_INVENTORY_SQL.get((available_rooms is not None, current_price is not None))
                     
-                    current_date += timedelta(days=1)
+                    updated_dates = []
+                    if sql:
+                        values = [value for value in (available_rooms, current_price) if value is not None]
+                        cursor.execute(sql, (*values, property_id, room_type_id, range_start, range_end))
+                        updated_dates = sorted(row[0] for row in cursor.fetchall())
                 
                 conn.commit()
+                if updated_dates:
+                    # Occupancy is computed from available_rooms
+                    self._invalidate_analytics(property_id)
                 
                 return {
                     "success": True,
@@ -417,70 +895,41 @@ class PMSManager:
     # BOOKING MANAGEMENT
     # ========================
     
-    def get_bookings(self, property_id: str = None, booking_status: str = None,
-                    start_date: str = None, end_date: str = None) -> List[Dict]:
-        """Get bookings with filters"""
-        try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
-                query = """
-                    SELECT b.booking_id, b.booking_reference, h.hotel_name, rt.room_name,
-                           b.guest_name, b.guest_email, b.guest_phone,
-                           b.check_in_date, b.check_out_date, b.nights, b.rooms_booked,
-                           b.total_price, b.currency, b.booking_status, b.payment_status,
-                           b.special_requests, b.booked_at, b.updated_at
-                    FROM bookings b
-                    JOIN hotels h ON b.property_id = h.property_id
-                    JOIN room_types rt ON b.room_type_id = rt.room_type_id
-                    WHERE 1=1
-                """
-                params = []
-                
-                if property_id:
-                    query += " AND b.property_id = ?"
-                    params.append(property_id)
-                
-                if booking_status:
-                    query += " AND b.booking_status = ?"
-                    params.append(booking_status)
-                
-                if start_date:
-                    query += " AND b.check_in_date >= ?"
-                    params.append(start_date)
-                
-                if end_date:
-                    query += " AND b.check_out_date <= ?"
-                    params.append(end_date)
-                
-                query += " ORDER BY b.booked_at DESC"
+    def iter_bookings(self, property_id: str = None, booking_status: str = None,
+                      start_date: str = None, end_date: str = None,
+                      limit: Optional[int] = BOOKINGS_DEFAULT_LIMIT) -> Iterator[Dict]:
+        """Yield bookings with filters, newest first, as the cursor is stepped.
+
+        Paginated views can itertools.islice this instead of building every dict.
+        The pooled connection stays borrowed until the iterator is exhausted or closed.
+        """
+        with self.get_connection() as conn:
+            cursor = conn.cursor()
+            
+            # SQLite treats a negative LIMIT as no limit
+            row_limit = -1 if limit is None else limit
+            
+            if property_id and not (booking_status or start_date or end_date):
+                # Common case: skip building the filter key entirely
+                cursor.execute(_SQL_BOOKINGS_BY_PROP, (property_id, row_limit))
+            else:
+                # Finished SQL for this combination of filters, built once at import
+                filters = (property_id, booking_status, start_date, end_date)
+                query = _SQL_BOOKINGS[tuple(bool(value) for value in filters)]
+                params = [value for value in filters if value]
+                params.append(row_limit)
                 
                 cursor.execute(query, params)
-                
-                bookings = []
-                for row in cursor.fetchall():
-                    bookings.append({
-                        'booking_id': row[0],
-                        'booking_reference': row[1],
-                        'hotel_name': row[2],
-                        'room_name': row[3],
-                        'guest_name': row[4],
-                        'guest_email': row[5],
-                        'guest_phone': row[6],
-                        'check_in_date': row[7],
-                        'check_out_date': row[8],
-                        'nights': row[9],
-                        'rooms_booked': row[10],
-                        'total_price': row[11],
-                        'currency': row[12],
-                        'booking_status': row[13],
-                        'payment_status': row[14],
-                        'special_requests': row[15],
-                        'booked_at': row[16],
-                        'updated_at': row[17]
-                    })
-                
-                return bookings
+            
+            # Column names already match the response keys
+            yield from _iter_row_dicts(cursor)
+    
+    def get_bookings(self, property_id: str = None, booking_status: str = None,
+                    start_date: str = None, end_date: str = None,
+                    limit: Optional[int] = BOOKINGS_DEFAULT_LIMIT) -> List[Dict]:
+        """Get bookings with filters, newest first, capped at limit rows"""
+        try:
+            return list(self.iter_bookings(property_id, booking_status, start_date, end_date, limit))
         except Exception as e:
             print(f"Error getting bookings: {e}")
             return []
@@ -488,49 +937,15 @@ class PMSManager:
     def cancel_booking(self, booking_reference: str, cancellation_reason: str = "") -> Dict:
         """Cancel a booking and restore inventory"""
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 
-                # Get booking details
-                cursor.execute("""
-                    SELECT booking_status, property_id, room_type_id, check_in_date, 
-                           check_out_date, rooms_booked, guest_name
-                    FROM bookings
-                    WHERE booking_reference = ?
-                """, (booking_reference,))
+                # Lock before reading so the status check and the inventory restore
+                # happen in one write transaction
+                cursor.execute("BEGIN IMMEDIATE")
                 
-                booking = cursor.fetchone()
-                if not booking:
-                    return {"success": False, "message": "Booking not found"}
-                
-                current_status, property_id, room_type_id, check_in_str, check_out_str, rooms_booked, guest_name = booking
-                
-                if current_status == 'CANCELLED':
-                    return {"success": False, "message": "Booking already cancelled"}
-                
-                # Restore inventory
-                check_in_date = datetime.strptime(check_in_str, '%Y-%m-%d').date()
-                check_out_date = datetime.strptime(check_out_str, '%Y-%m-%d').date()
-                
-                current_date = check_in_date
-                restored_dates = []
-                
-                while current_date < check_out_date:
-                    date_str = current_date.strftime('%Y-%m-%d')
-                    
-                    cursor.execute("""
-                        UPDATE room_inventory 
-                        SET available_rooms = available_rooms + ?,
-                            updated_at = CURRENT_TIMESTAMP
-                        WHERE property_id = ? AND room_type_id = ? AND stay_date = ?
-                    """, (rooms_booked, property_id, room_type_id, date_str))
-                    
-                    if cursor.rowcount > 0:
-                        restored_dates.append(date_str)
-                    
-                    current_date += timedelta(days=1)
-                
-                # Update booking status
+                # Cancel the booking and read back what the inventory restore needs
+                # in one statement; no row means missing or already cancelled
                 cursor.execute("""
                     UPDATE bookings 
                     SET booking_status = 'CANCELLED',
@@ -538,17 +953,39 @@ class PMSManager:
                                          CASE WHEN special_requests IS NOT NULL THEN ' | ' ELSE '' END ||
                                          'CANCELLED: ' || ?,
                         updated_at = CURRENT_TIMESTAMP
-                    WHERE booking_reference = ?
+                    WHERE booking_reference = ? AND booking_status <> 'CANCELLED'
+                    RETURNING property_id, room_type_id, check_in_date, check_out_date, rooms_booked, guest_name
                 """, (cancellation_reason or "Cancelled by hotel", booking_reference))
                 
+                booking = cursor.fetchone()
+                if not booking:
+                    cursor.execute("SELECT 1 FROM bookings WHERE booking_reference = ?", (booking_reference,))
+                    if cursor.fetchone():
+                        return {"success": False, "message": "Booking already cancelled"}
+                    return {"success": False, "message": "Booking not found"}
+                
+                property_id, room_type_id, check_in_str, check_out_str, rooms_booked, guest_name = booking
+                
+                # Restore inventory for every night of the stay in one statement
+                # (half-open range: the check-out date itself is not a stay night)
+                cursor.execute("""
+                    UPDATE room_inventory 
+                    SET available_rooms = available_rooms + ?,
+                        updated_at = CURRENT_TIMESTAMP
+                    WHERE property_id = ? AND room_type_id = ? AND stay_date >= ? AND stay_date < ?
+                """, (rooms_booked, property_id, room_type_id, check_in_str, check_out_str))
+                restored_dates = cursor.rowcount
+                
                 conn.commit()
+                self.get_hotel_details.cache_clear(property_id)
+                self._invalidate_analytics(property_id)
                 
                 return {
                     "success": True,
                     "booking_reference": booking_reference,
                     "guest_name": guest_name,
-                    "inventory_restored": len(restored_dates),
-                    "message": f"Booking cancelled and {rooms_booked} rooms restored for {len(restored_dates)} dates"
+                    "inventory_restored": restored_dates,
+                    "message": f"Booking cancelled and {rooms_booked} rooms restored for {restored_dates} dates"
                 }
                 
         except Exception as e:
@@ -558,18 +995,9 @@ class PMSManager:
                             payment_status: str = None, notes: str = "") -> Dict:
         """Update booking status and/or payment status"""
         try:
-            with self.get_connection() as conn:
+            with self.get_connection(write=True) as conn:
                 cursor = conn.cursor()
                 
-                # Check if booking exists
-                cursor.execute("SELECT booking_id, booking_reference, guest_name FROM bookings WHERE booking_id = ?", 
-                             (booking_id,))
-                booking = cursor.fetchone()
-                if not booking:
-                    return {"success": False, "message": "Booking not found"}
-                
-                _, booking_reference, guest_name = booking
-                
                 # Build update query dynamically
                 update_fields = []
                 update_values = []
@@ -594,15 +1022,26 @@ class PMSManager:
                 if not update_fields or len(update_fields) == 1:  # Only timestamp update
                     return {"success": False, "message": "No valid updates provided"}
                 
-                # Execute update
+                # Execute update; RETURNING doubles as the existence check
                 update_values.append(booking_id)
                 cursor.execute(f"""
                     UPDATE bookings 
                     SET {', '.join(update_fields)}
                     WHERE booking_id = ?
+                    RETURNING property_id, booking_reference, guest_name
                 """, update_values)
                 
+                booking = cursor.fetchone()
+                if not booking:
+                    return {"success": False, "message": "Booking not found"}
+                
+                property_id, booking_reference, guest_name = booking
+                
                 conn.commit()
+                if booking_status:
+                    # Hotel details report the active booking count
+                    self.get_hotel_details.cache_clear(property_id)
+                    self._invalidate_analytics(property_id)
                 
                 return {
                     "success": True,
@@ -619,95 +1058,59 @@ class PMSManager:
     # ANALYTICS & REPORTING
     # ========================
     
+    @_ttl_cache(ANALYTICS_CACHE_TTL_SECONDS, cache_if=lambda result: result["success"])
     def get_hotel_analytics(self, property_id: str, days: int = 30) -> Dict:
         """Get hotel analytics and statistics"""
+        cached = self._shared_cache.get(property_id, days)
+        if cached is not None:
+            return cached
+        
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
                 
-                start_date = (date.today() - timedelta(days=days)).strftime('%Y-%m-%d')
-                end_date = date.today().strftime('%Y-%m-%d')
+                today = date.today()
+                start_date = (today - timedelta(days=days)).isoformat()
+                end_date = today.isoformat()
                 
-                # Booking statistics
-                cursor.execute("""
-                    SELECT 
-                        COUNT(*) as total_bookings,
-                        COUNT(CASE WHEN booking_status = 'CONFIRMED' THEN 1 END) as confirmed_bookings,
-                        COUNT(CASE WHEN booking_status = 'CANCELLED' THEN 1 END) as cancelled_bookings,
-                        SUM(CASE WHEN booking_status = 'CONFIRMED' THEN total_price ELSE 0 END) as total_revenue,
-                        SUM(CASE WHEN booking_status = 'CONFIRMED' THEN rooms_booked ELSE 0 END) as total_room_nights
-                    FROM bookings
-                    WHERE property_id = ? AND booked_at >= ?
-                """, (property_id, start_date))
-                
-                booking_stats = cursor.fetchone()
-                
-                # Occupancy rate
-                cursor.execute("""
-                    SELECT 
-                        SUM(rt.total_rooms) as total_room_capacity,
-                        SUM(ri.available_rooms) as total_available,
-                        COUNT(DISTINCT ri.stay_date) as days_counted
-                    FROM room_inventory ri
-                    JOIN room_types rt ON ri.property_id = rt.property_id 
-                                       AND ri.room_type_id = rt.room_type_id
-                    WHERE ri.property_id = ? AND ri.stay_date BETWEEN ? AND ?
-                """, (property_id, start_date, end_date))
-                
-                capacity_stats = cursor.fetchone()
-                
-                # Room type performance
-                cursor.execute("""
-                    SELECT rt.room_name, 
-                           COUNT(b.booking_id) as bookings,
-                           SUM(b.total_price) as revenue
-                    FROM room_types rt
-                    LEFT JOIN bookings b ON rt.property_id = b.property_id 
-                                         AND rt.room_type_id = b.room_type_id
-                                         AND b.booking_status = 'CONFIRMED'
-                                         AND b.booked_at >= ?
-                    WHERE rt.property_id = ?
-                    GROUP BY rt.room_type_id, rt.room_name
-                    ORDER BY revenue DESC
-                """, (start_date, property_id))
-                
-                room_performance = []
-                for row in cursor.fetchall():
-                    room_performance.append({
-                        'room_name': row[0],
-                        'bookings': row[1] or 0,
-                        'revenue': row[2] or 0
-                    })
-                
-                # Calculate occupancy rate
-                total_capacity = capacity_stats[0] or 1
-                total_available = capacity_stats[1] or 0
-                days_counted = capacity_stats[2] or 1
-                
-                occupancy_rate = ((total_capacity - total_available) / total_capacity) * 100 if total_capacity > 0 else 0
+                cursor.execute(_SQL_HOTEL_ANALYTICS, {
+                    "property_id": property_id, "start_date": start_date, "end_date": end_date
+                })
                 
-                return {
+                # 'summary' sorts ahead of the 'perf' rows; its ratios and
+                # fallbacks for empty windows are already computed in SQL
+                (total, confirmed, cancelled, conversion_rate, revenue, average_per_booking,
+                 occupancy_rate, room_nights_sold, total_capacity) = cursor.fetchone()[2:]
+                room_performance = [
+                    {'room_name': row[1], 'bookings': row[2], 'revenue': row[3]}
+                    for row in cursor
+                ]
+                
+                result = {
                     "success": True,
                     "analytics": {
                         "period_days": days,
                         "bookings": {
-                            "total": booking_stats[0] or 0,
-                            "confirmed": booking_stats[1] or 0,
-                            "cancelled": booking_stats[2] or 0,
-                            "conversion_rate": (booking_stats[1] / booking_stats[0] * 100) if booking_stats[0] > 0 else 0
+                            "total": total,
+                            "confirmed": confirmed,
+                            "cancelled": cancelled,
+                            "conversion_rate": conversion_rate
                         },
                         "revenue": {
-                            "total": booking_stats[3] or 0,
-                            "average_per_booking": (booking_stats[3] / booking_stats[1]) if booking_stats[1] > 0 else 0
+                            "total": revenue,
+                            "average_per_booking": average_per_booking
                         },
                         "occupancy": {
-                            "rate": round(occupancy_rate, 2),
-                            "room_nights_sold": booking_stats[4] or 0,
-                            "total_capacity": total_capacity * days_counted
+                            "rate": occupancy_rate,
+                            "room_nights_sold": room_nights_sold,
+                            "total_capacity": total_capacity
                         },
                         "room_performance": room_performance
                     }
                 }
+            
+            self._shared_cache.set(property_id, days, result)
+            return result
                 
         except Exception as e:
             return {"success": False, "message": f"Error getting analytics: {str(e)}"}
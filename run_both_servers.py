@@ -4,12 +4,14 @@ Run Both ELLA and LEON Servers
 - ELLA: Guest-facing chat assistant (port 8000)
 - LEON: Hotel management system (port 8001)
 - Voice server: OpenAI Realtime API (port 8004)
+
+Procfile.dev starts the same servers under honcho (or any Procfile runner)
+without this supervising Python process.
 """
 
-import subprocess
+import asyncio
 import sys
 import time
-import threading
 import signal
 import os
 from pathlib import Path
@@ -29,8 +31,13 @@ class Colors:
 def print_colored(message, color):
     print(f"{color}{message}{Colors.ENDC}")
 
-def run_server(script_name, server_name, port, color):
-    """Run a server in a separate thread"""
+def log_prefixes(server_name, color):
+    """Encoded constant parts of a server log line: before and after the timestamp, and the line end"""
+    return f"{color}[".encode(), f"] {server_name}: ".encode(), f"{Colors.ENDC}\n".encode()
+
+async def run_server(script_name, server_name, port, color):
+    """Run a server as a child process, streaming its output on the event loop"""
+    process = None
     try:
         print_colored(f"🚀 Starting {server_name} on port {port}...", color)
         
@@ -40,31 +47,60 @@ def run_server(script_name, server_name, port, color):
             return
         
         # Run the server
-        process = subprocess.Popen(
-            [sys.executable, script_name],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
+        process = await asyncio.create_subprocess_exec(
+            sys.executable, script_name,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            limit=1024 * 1024  # long tracebacks/log lines
         )
         
-        # Stream output with color coding
-        for line in iter(process.stdout.readline, ''):
-            if line.strip():
-                timestamp = time.strftime("%H:%M:%S")
-                print_colored(f"[{timestamp}] {server_name}: {line.strip()}", color)
+        # Stream output with color coding, passing the child's bytes straight
+        # through instead of decoding and re-encoding every line
+        head, label, tail = log_prefixes(server_name, color)
+        out = sys.stdout.buffer
+        while True:
+            try:
+                raw_line = await process.stdout.readuntil(b"\n")
+            except asyncio.IncompleteReadError as e:
+                raw_line = e.partial  # output ended without a trailing newline
+                if not raw_line:
+                    break
+            except asyncio.LimitOverrunError as e:
+                # Line longer than the buffer limit: pass it through in chunks
+                # rather than stop draining the pipe and stall the child
+                raw_line = await process.stdout.read(e.consumed)
+            line = raw_line.strip()
+            if line:
+                timestamp = time.strftime("%H:%M:%S").encode()
+                sys.stdout.flush()  # keep ordering with print_colored's text writes
+                out.write(head + timestamp + label + line + tail)
+                out.flush()
         
-        process.wait()
+        await process.wait()
         
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
         print_colored(f"🛑 Stopping {server_name}...", Colors.WARNING)
-        if 'process' in locals():
-            process.terminate()
+        await stop_process(process)
+        raise
     except Exception as e:
         print_colored(f"❌ Error running {server_name}: {e}", Colors.FAIL)
+        # Nobody is reading the pipe any more, so don't leave the child blocked on it
+        await stop_process(process)
+
+async def stop_process(process):
+    """Terminate a child server if it is still running, killing it after 5 seconds"""
+    if process is None or process.returncode is not None:
+        return
+    process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), timeout=5)
+    except asyncio.TimeoutError:
+        process.kill()
 
-def check_ports():
+def check_ports(timeout=0.5):
     """Check if required ports are available"""
+    import errno
+    import selectors
     import socket
     
     ports_to_check = [
@@ -73,18 +109,45 @@ def check_ports():
         (8004, "Voice Server")
     ]
     
-    for port, service in ports_to_check:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        result = sock.connect_ex(('localhost', port))
-        sock.close()
+    # Probe every port at once with non-blocking connects; a connect that
+    # succeeds means something is already listening there
+    in_progress = (errno.EINPROGRESS, errno.EWOULDBLOCK, errno.EALREADY)
+    in_use = set()
+    selector = selectors.DefaultSelector()
+    sockets = []
+    try:
+        for port, service in ports_to_check:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            sockets.append(sock)
+            sock.setblocking(False)
+            result = sock.connect_ex(('localhost', port))
+            if result == 0:
+                in_use.add(port)
+            elif result in in_progress:
+                selector.register(sock, selectors.EVENT_WRITE, port)
         
-        if result == 0:
+        # Ports still pending at the timeout are treated as free
+        deadline = time.monotonic() + timeout
+        while selector.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for key, _ in selector.select(remaining):
+                if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    in_use.add(key.data)
+                selector.unregister(key.fileobj)
+    finally:
+        selector.close()
+        for sock in sockets:
+            sock.close()
+    
+    for port, service in ports_to_check:
+        if port in in_use:
             print_colored(f"⚠️  Warning: Port {port} ({service}) is already in use", Colors.WARNING)
-            return False
     
-    return True
+    return not in_use
 
-def main():
+async def main():
     print_colored("=" * 60, Colors.HEADER)
     print_colored("🏨 ELLA HOTEL SYSTEM - DUAL SERVER STARTUP", Colors.HEADER)
     print_colored("=" * 60, Colors.HEADER)
@@ -127,42 +190,30 @@ def main():
     print_colored("   Press Ctrl+C to stop all servers", Colors.WARNING)
     print()
     
-    # Storage for server threads
-    threads = []
+    # One task per server; all output is drained by this event loop
+    tasks = []
     
     try:
         # Start ELLA (Guest Assistant)
         if ("main.py", "ELLA Guest Assistant") in available_servers:
-            ella_thread = threading.Thread(
-                target=run_server,
-                args=("main.py", "ELLA", 8000, Colors.OKGREEN),
-                daemon=True
-            )
-            ella_thread.start()
-            threads.append(ella_thread)
-            time.sleep(2)  # Stagger startup
+            tasks.append(asyncio.create_task(
+                run_server("main.py", "ELLA", 8000, Colors.OKGREEN)
+            ))
+            await asyncio.sleep(2)  # Stagger startup
         
         # Start LEON (Hotel Manager)
         if ("leon_server.py", "LEON Hotel Manager") in available_servers:
-            leon_thread = threading.Thread(
-                target=run_server,
-                args=("leon_server.py", "LEON", 8001, Colors.OKCYAN),
-                daemon=True
-            )
-            leon_thread.start()
-            threads.append(leon_thread)
-            time.sleep(2)  # Stagger startup
+            tasks.append(asyncio.create_task(
+                run_server("leon_server.py", "LEON", 8001, Colors.OKCYAN)
+            ))
+            await asyncio.sleep(2)  # Stagger startup
         
         # Start Voice Server (optional)
         if ("voice_hotel.py", "Voice Server") in available_servers:
-            voice_thread = threading.Thread(
-                target=run_server,
-                args=("voice_hotel.py", "VOICE", 8004, Colors.WARNING),
-                daemon=True
-            )
-            voice_thread.start()
-            threads.append(voice_thread)
-            time.sleep(2)  # Stagger startup
+            tasks.append(asyncio.create_task(
+                run_server("voice_hotel.py", "VOICE", 8004, Colors.WARNING)
+            ))
+            await asyncio.sleep(2)  # Stagger startup
         
         print()
         print_colored("✅ All servers started successfully!", Colors.OKGREEN)
@@ -190,26 +241,28 @@ def main():
         print_colored("   • LEON Stats:  http://localhost:8001/api/stats", Colors.OKCYAN)
         print()
         
-        # Keep main thread alive
-        while True:
-            time.sleep(1)
+        # Run until every server exits
+        await asyncio.gather(*tasks)
             
-    except KeyboardInterrupt:
+    except asyncio.CancelledError:
+        # asyncio.run cancels main() on Ctrl+C
         print()
         print_colored("🛑 Shutdown signal received. Stopping all servers...", Colors.WARNING)
         print()
         
-        # Wait for threads to finish
-        for thread in threads:
-            if thread.is_alive():
-                thread.join(timeout=5)
+        # Cancelling a server task terminates its process
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
         
         print_colored("✅ All servers stopped successfully.", Colors.OKGREEN)
         print_colored("👋 Thank you for using ELLA Hotel System!", Colors.HEADER)
 
 if __name__ == "__main__":
     try:
-        main()
+        asyncio.run(main())
+    except KeyboardInterrupt:
+        pass
     except Exception as e:
         print_colored(f"❌ Critical error: {e}", Colors.FAIL)
         sys.exit(1) 
\ No newline at end of file
@@ -4,6 +4,7 @@ Ella Hotel Assistant - Configuration Settings
 All API keys, database paths, and system configurations
 """
 
+import logging
 import os
 
 # Database Configuration
@@ -47,9 +48,14 @@ PAYMENT_WINDOW_MINUTES = 30
 
 # Media Configuration
 MAX_MEDIA_SIZE_MB = 100
-SUPPORTED_IMAGE_FORMATS = [".jpg", ".jpeg", ".png"]
-SUPPORTED_VIDEO_FORMATS = [".mp4", ".mov"]
-SUPPORTED_DOCUMENT_FORMATS = [".pdf", ".doc", ".docx"]
+SUPPORTED_IMAGE_FORMATS = frozenset({".jpg", ".jpeg", ".png"})
+SUPPORTED_VIDEO_FORMATS = frozenset({".mp4", ".mov"})
+SUPPORTED_DOCUMENT_FORMATS = frozenset({".pdf", ".doc", ".docx"})
+ALL_SUPPORTED_FORMATS = SUPPORTED_IMAGE_FORMATS | SUPPORTED_VIDEO_FORMATS | SUPPORTED_DOCUMENT_FORMATS
+
+def is_supported(path: str) -> bool:
+    """True if the file extension is an accepted media format (case-insensitive)"""
+    return os.path.splitext(path)[1].lower() in ALL_SUPPORTED_FORMATS
 
 # Rate Limiting
 MAX_REQUESTS_PER_MINUTE = 60
@@ -59,8 +65,15 @@ MAX_MEDIA_UPLOADS_PER_DAY = 100
 SESSION_TIMEOUT_MINUTES = 60
 MAX_FAILED_ATTEMPTS = 5
 
-print("⚙️ Settings loaded successfully")
-print(f"📱 WhatsApp Phone Number ID: {WHATSAPP_PHONE_NUMBER_ID}")
-print(f"🔑 WhatsApp API: {'✅ Configured' if WHATSAPP_ACCESS_TOKEN else '❌ Not configured'}")
-print(f"🤖 OpenAI API: {'✅ Configured' if OPENAI_API_KEY else '❌ Not configured'}")
-print(f"☁️ AWS S3 Bucket: {AWS_BUCKET_NAME}") 
\ No newline at end of file
+def log_config_summary(logger=None):
+    """Log which integrations are configured; call once at service startup"""
+    logger = logger or logging.getLogger(__name__)
+    logger.info("⚙️ Settings loaded successfully")
+    logger.info("📱 WhatsApp Phone Number ID: %s", WHATSAPP_PHONE_NUMBER_ID)
+    logger.info("🔑 WhatsApp API: %s", "✅ Configured" if WHATSAPP_ACCESS_TOKEN else "❌ Not configured")
+    logger.info("🤖 OpenAI API: %s", "✅ Configured" if OPENAI_API_KEY else "❌ Not configured")
+    logger.info("☁️ AWS S3 Bucket: %s", AWS_BUCKET_NAME)
+
+if __name__ == "__main__":
+    logging.basicConfig(level=LOG_LEVEL, format="%(message)s")
+    log_config_summary()
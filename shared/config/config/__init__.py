@@ -1,11 +0,0 @@
-import os
-from dotenv import load_dotenv
-
-# Load environment variables from .env file
-load_dotenv()
-
-# OpenAI API Configuration
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-
-# MongoDB Configuration
-MONGO_URI = "mongodb://localhost:27017/ella" 
\ No newline at end of file